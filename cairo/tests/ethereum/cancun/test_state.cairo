@@ -0,0 +1,38 @@
+from starkware.cairo.common.cairo_builtins import PoseidonBuiltin
+
+from ethereum_types.bytes import Bytes32
+from ethereum_types.numeric import U256, bool
+from ethereum.cancun.fork_types import Address
+from ethereum.cancun.state import (
+    State,
+    account_exists,
+    account_exists_and_is_empty,
+    account_has_code_or_nonce,
+    get_storage,
+    get_storage_original,
+    is_account_alive,
+    is_account_empty,
+)
+
+// Evaluates all the account predicates for the same address in a single run.
+func test_account_predicates{poseidon_ptr: PoseidonBuiltin*, state: State}(address: Address) -> (
+    bool, bool, bool, bool, bool
+) {
+    alloc_locals;
+    let exists = account_exists(address);
+    let empty = is_account_empty(address);
+    let exists_and_empty = account_exists_and_is_empty(address);
+    let alive = is_account_alive(address);
+    let has_code_or_nonce = account_has_code_or_nonce(address);
+    return (exists, empty, exists_and_empty, alive, has_code_or_nonce);
+}
+
+// Reads both the current and the original value of a storage slot in a single run.
+func test_get_storage_values{range_check_ptr, poseidon_ptr: PoseidonBuiltin*, state: State}(
+    address: Address, key: Bytes32
+) -> (U256, U256) {
+    alloc_locals;
+    let value = get_storage(address, key);
+    let original_value = get_storage_original(address, key);
+    return (value, original_value);
+}
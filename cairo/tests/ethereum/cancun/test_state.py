@@ -1,7 +1,5 @@
-import copy
-from typing import Mapping, Optional
+from typing import Dict, Mapping, Optional
 
-import pytest
 from ethereum.cancun.fork_types import EMPTY_ACCOUNT, Account, Address
 from ethereum.cancun.state import (
     account_exists,
@@ -37,7 +35,7 @@ from ethereum.cancun.state import (
 from ethereum.cancun.trie import Trie, copy_trie
 from ethereum_types.bytes import Bytes32
 from ethereum_types.numeric import U256
-from hypothesis import given, settings
+from hypothesis import given, settings, target
 from hypothesis import strategies as st
 from hypothesis.strategies import composite
 
@@ -48,11 +46,21 @@ from tests.utils.strategies import (
     bytes32,
     code,
     state,
+    storage_trie_strategy,
     transient_storage,
-    trie_strategy,
 )
 
 
+def copy_tries(tries: Dict[Address, Trie]) -> Dict[Address, Trie]:
+    """
+    Copy a mapping of tries, only duplicating the trie containers.
+
+    Keys and values of the tries (addresses, accounts, storage values) are immutable,
+    so they are shared between the copies instead of being deep-copied.
+    """
+    return {address: copy_trie(trie) for address, trie in tries.items()}
+
+
 @composite
 def state_and_address_and_optional_key(
     draw,
@@ -71,6 +79,9 @@ def state_and_address_and_optional_key(
     address_options.append(address_strategy)
 
     address = draw(st.one_of(*address_options))
+    # Guide the targeting phase towards addresses present in the state, as random
+    # addresses mostly exercise the missing account path
+    target(float(address in state._main_trie._data), label="address_in_state")
 
     # For key selection, use key_strategy if no storage keys for this address
     if key_strategy is None:
@@ -98,7 +109,7 @@ def state_with_snapshots(draw):
 
     # Start with base state's tries
     current_main_trie = base_state._main_trie
-    current_storage_tries = copy.deepcopy(base_state._storage_tries)
+    current_storage_tries = copy_tries(base_state._storage_tries)
     snapshots = []
 
     for _ in range(num_snapshots):
@@ -114,11 +125,11 @@ def state_with_snapshots(draw):
         new_storage_tries = draw(
             st.dictionaries(
                 keys=address,
-                values=trie_strategy(Trie[Bytes32, U256], min_size=1),
+                values=storage_trie_strategy,
                 max_size=5,
             )
         )
-        storage_tries = copy.deepcopy(current_storage_tries)
+        storage_tries = copy_tries(current_storage_tries)
         # Deep update - merge inner tries instead of overwriting
         for addr, new_trie in new_storage_tries.items():
             if addr in storage_tries:
@@ -148,7 +159,7 @@ def transient_storage_with_snapshots(draw):
     num_snapshots = draw(st.integers(min_value=0, max_value=5))
 
     # Start with base transient storage tries
-    current_tries = copy.deepcopy(base_transient_storage._tries)
+    current_tries = copy_tries(base_transient_storage._tries)
     snapshots = []
 
     for _ in range(num_snapshots):
@@ -157,11 +168,11 @@ def transient_storage_with_snapshots(draw):
         new_tries = draw(
             st.dictionaries(
                 keys=address,
-                values=trie_strategy(Trie[Bytes32, U256], min_size=1),
+                values=storage_trie_strategy,
                 max_size=5,
             )
         )
-        tries = copy.deepcopy(current_tries)
+        tries = copy_tries(current_tries)
         # Deep update - merge inner tries instead of overwriting
         for addr, new_trie in new_tries.items():
             if addr in tries:
@@ -293,12 +304,18 @@ class TestStateAccounts:
         assert state_cairo == state
 
     @given(data=state_and_address_and_optional_key())
-    def test_account_has_code_or_nonce(self, cairo_run, data):
+    def test_account_predicates(self, cairo_run, data):
         state, address = data
-        state_cairo, result_cairo = cairo_run(
-            "account_has_code_or_nonce", state, address
+        state_cairo, predicates_cairo = cairo_run(
+            "test_account_predicates", state, address
         )
-        assert result_cairo == account_has_code_or_nonce(state, address)
+        assert predicates_cairo == [
+            account_exists(state, address),
+            is_account_empty(state, address),
+            account_exists_and_is_empty(state, address),
+            is_account_alive(state, address),
+            account_has_code_or_nonce(state, address),
+        ]
         assert state_cairo == state
 
     @given(
@@ -328,20 +345,6 @@ class TestStateAccounts:
         assert result_cairo == account_has_storage(state, address)
         assert state_cairo == state
 
-    @given(data=state_and_address_and_optional_key())
-    def test_account_exists(self, cairo_run, data):
-        state, address = data
-        state_cairo, result_cairo = cairo_run("account_exists", state, address)
-        assert result_cairo == account_exists(state, address)
-        assert state_cairo == state
-
-    @given(data=state_and_address_and_optional_key())
-    def test_is_account_empty(self, cairo_run, data):
-        state, address = data
-        state_cairo, result_cairo = cairo_run("is_account_empty", state, address)
-        assert result_cairo == is_account_empty(state, address)
-        assert state_cairo == state
-
     @given(data=state_and_address_and_optional_key())
     def test_is_account_empty_high_balance(self, cairo_run, data):
         state, address = data
@@ -357,22 +360,6 @@ class TestStateAccounts:
         mark_account_created(state, address)
         assert state_cairo == state
 
-    @given(data=state_and_address_and_optional_key())
-    def test_account_exists_and_is_empty(self, cairo_run, data):
-        state, address = data
-        state_cairo, result_cairo = cairo_run(
-            "account_exists_and_is_empty", state, address
-        )
-        assert result_cairo == account_exists_and_is_empty(state, address)
-        assert state_cairo == state
-
-    @given(data=state_and_address_and_optional_key())
-    def test_is_account_alive(self, cairo_run, data):
-        state, address = data
-        state_cairo, result_cairo = cairo_run("is_account_alive", state, address)
-        assert result_cairo == is_account_alive(state, address)
-        assert state_cairo == state
-
     @given(
         data=state_and_address_and_optional_key(),
         code=code,
@@ -432,23 +419,13 @@ class TestStateAccounts:
 
 class TestStateStorage:
     @given(data=state_and_address_and_optional_key(key_strategy=bytes32))
-    def test_get_storage_original(self, cairo_run, data):
+    def test_get_storage_values(self, cairo_run, data):
         state, address, key = data
-        state_cairo, result_cairo = cairo_run(
-            "get_storage_original", state, address, key
+        state_cairo, (value_cairo, original_value_cairo) = cairo_run(
+            "test_get_storage_values", state, address, key
         )
-        assert result_cairo == get_storage_original(state, address, key)
-        assert state_cairo == state
-
-    @given(data=state_and_address_and_optional_key(key_strategy=bytes32))
-    def test_get_storage(
-        self,
-        cairo_run,
-        data,
-    ):
-        state, address, key = data
-        state_cairo, result_cairo = cairo_run("get_storage", state, address, key)
-        assert result_cairo == get_storage(state, address, key)
+        assert value_cairo == get_storage(state, address, key)
+        assert original_value_cairo == get_storage_original(state, address, key)
         assert state_cairo == state
 
     @given(data=state_and_address_and_optional_key(key_strategy=bytes32), value=...)
@@ -456,11 +433,10 @@ class TestStateStorage:
         state, address, key = data
         try:
             state_cairo = cairo_run("set_storage", state, address, key, value)
-        except Exception as e:
-            with pytest.raises(type(e)):
+        except Exception as cairo_error:
+            with strict_raises(type(cairo_error)):
                 set_storage(state, address, key, value)
             return
-
         set_storage(state, address, key, value)
         assert state_cairo == state
 
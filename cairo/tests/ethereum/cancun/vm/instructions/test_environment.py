@@ -48,7 +48,7 @@ from tests.utils.strategies import (
 environment_empty_state = st.builds(
     Environment,
     caller=...,
-    block_hashes=st.builds(list, st.just([])),
+    block_hashes=st.builds(list),
     origin=...,
     coinbase=...,
     number=...,
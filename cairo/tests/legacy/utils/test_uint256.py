@@ -14,7 +14,7 @@ class TestUint256:
             a=integers(min_value=0, max_value=2**256 - 1),
             b=integers(min_value=0, max_value=2**256 - 1),
         )
-        @settings(max_examples=50)
+        @settings(max_examples=50, deadline=None)
         def test_add(self, cairo_run, a, b):
             low, high, carry = cairo_run(
                 "test__uint256_add", a=int_to_uint256(a), b=int_to_uint256(b)
@@ -27,7 +27,7 @@ class TestUint256:
             a=integers(min_value=0, max_value=2**256 - 1),
             b=integers(min_value=0, max_value=2**256 - 1),
         )
-        @settings(max_examples=50)
+        @settings(max_examples=50, deadline=None)
         def test_sub(self, cairo_run, a, b):
             res = cairo_run(
                 "test__uint256_sub", a=int_to_uint256(a), b=int_to_uint256(b)
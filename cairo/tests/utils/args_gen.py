@@ -93,7 +93,6 @@ from ethereum.cancun.trie import (
     LeafNode,
     Node,
     Trie,
-    trie_get,
     trie_set,
 )
 from ethereum.cancun.vm import Environment as EnvironmentBase
@@ -225,8 +224,7 @@ class FlatState:
 
         # Flatten storage tries
         for address, storage_trie in state._storage_tries.items():
-            for key in storage_trie._data.keys():
-                value = trie_get(storage_trie, key)
+            for key, value in storage_trie._data.items():
                 trie_set(flat_state._storage_tries, (address, key), value)
 
         # Flatten snapshots
@@ -238,8 +236,7 @@ class FlatState:
                 defaultdict(lambda: U256(0), {}),
             )
             for address, storage_trie in snapshot[1].items():
-                for key in storage_trie._data.keys():
-                    value = trie_get(storage_trie, key)
+                for key, value in storage_trie._data.items():
                     trie_set(snapshot_storage_tries, (address, key), value)
             flat_state._snapshots.append((snapshot_main_trie, snapshot_storage_tries))
 
@@ -307,8 +304,7 @@ class FlatTransientStorage:
 
         # Flatten tries
         for address, storage_trie in ts._tries.items():
-            for key in storage_trie._data.keys():
-                value = trie_get(storage_trie, key)
+            for key, value in storage_trie._data.items():
                 trie_set(flat_ts._tries, (address, key), value)
 
         # Flatten snapshots
@@ -319,8 +315,7 @@ class FlatTransientStorage:
                 defaultdict(lambda: U256(0), {}),
             )
             for address, storage_trie in snapshot.items():
-                for key in storage_trie._data.keys():
-                    value = trie_get(storage_trie, key)
+                for key, value in storage_trie._data.items():
                     trie_set(snapshot_tries, (address, key), value)
             flat_ts._snapshots.append(snapshot_tries)
 
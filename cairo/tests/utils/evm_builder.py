@@ -14,6 +14,7 @@ from tests.utils.strategies import (
     MAX_ACCOUNTS_TO_DELETE_SIZE,
     MAX_TOUCHED_ACCOUNTS_SIZE,
     Memory,
+    accessed_storage_keys,
     address_zero,
     code,
     empty_state,
@@ -29,7 +30,7 @@ from tests.utils.strategies import (
 empty_environment = st.builds(
     Environment,
     caller=st.just(address_zero),
-    block_hashes=st.builds(list, st.just([])),
+    block_hashes=st.builds(list),
     origin=st.just(address_zero),
     coinbase=st.just(address_zero),
     number=st.just(Uint(0)),
@@ -51,23 +52,23 @@ class EvmBuilder:
 
     def __init__(self):
         self._pc = st.just(Uint(0))
-        self._stack = st.builds(list, st.just([])).map(lambda x: Stack[U256](x))
+        self._stack = st.builds(list).map(lambda x: Stack[U256](x))
         self._memory = st.builds(Memory, st.just(b""))
         self._code = st.just(b"")
         self._gas_left = st.just(Uint(0))
         self._env = empty_environment
-        self._valid_jump_destinations = st.builds(set, st.just(set()))
+        self._valid_jump_destinations = st.builds(set)
         self._logs = st.just(())
         self._refund_counter = st.just(0)
         self._running = st.just(True)
         self._message = MessageBuilder().build()  # empty message
         self._output = st.just(b"")
-        self._accounts_to_delete = st.builds(set, st.just(set()))
-        self._touched_accounts = st.builds(set, st.just(set()))
+        self._accounts_to_delete = st.builds(set)
+        self._touched_accounts = st.builds(set)
         self._return_data = st.just(b"")
         self._error = st.none() | st.from_type(EthereumException)
-        self._accessed_addresses = st.builds(set, st.just(set()))
-        self._accessed_storage_keys = st.builds(set, st.just(set()))
+        self._accessed_addresses = st.builds(set)
+        self._accessed_storage_keys = st.builds(set)
 
     def with_pc(self, strategy=uint):
         self._pc = strategy
@@ -119,9 +120,7 @@ class EvmBuilder:
         self._accessed_addresses = strategy
         return self
 
-    def with_accessed_storage_keys(
-        self, strategy=st.sets(st.from_type(Tuple[Address, Bytes32]), max_size=10)
-    ):
+    def with_accessed_storage_keys(self, strategy=accessed_storage_keys):
         self._accessed_storage_keys = strategy
         return self
 
@@ -2,6 +2,7 @@
 
 import os
 from collections import ChainMap, defaultdict
+from functools import lru_cache, partial
 from typing import (
     ForwardRef,
     Generic,
@@ -65,31 +66,21 @@ uint128 = st.integers(min_value=0, max_value=2**128 - 1)
 felt = st.integers(min_value=0, max_value=DEFAULT_PRIME - 1)
 uint256 = st.integers(min_value=0, max_value=2**256 - 1).map(U256)
 uint384 = st.integers(min_value=0, max_value=2**384 - 1).map(U384)
-nibble = st.lists(uint4, max_size=64).map(bytes)
+# Masks each byte to its low nibble with bytes.translate
+_NIBBLE_TABLE = bytes(i & 0x0F for i in range(256))
+nibble = st.binary(max_size=64).map(lambda x: x.translate(_NIBBLE_TABLE))
 
 bytes0 = st.binary(min_size=0, max_size=0).map(Bytes0)
-bytes4 = st.integers(min_value=0, max_value=2**32 - 1).map(
-    lambda x: Bytes4(x.to_bytes(4, "little"))
-)
-bytes8 = st.integers(min_value=0, max_value=2**64 - 1).map(
-    lambda x: Bytes8(x.to_bytes(8, "little"))
-)
-bytes20 = st.integers(min_value=0, max_value=2**160 - 1).map(
-    lambda x: Bytes20(x.to_bytes(20, "little"))
-)
-bytes64 = st.integers(min_value=0, max_value=2**512 - 1).map(
-    lambda x: Bytes64(x.to_bytes(64, "little"))
-)
+bytes4 = st.binary(min_size=4, max_size=4).map(Bytes4)
+bytes8 = st.binary(min_size=8, max_size=8).map(Bytes8)
+bytes20 = st.binary(min_size=20, max_size=20).map(Bytes20)
+bytes64 = st.binary(min_size=64, max_size=64).map(Bytes64)
 address = bytes20.map(Address)
 address_zero = Bytes20(b"\x00" * 20)
-bytes32 = st.integers(min_value=0, max_value=2**256 - 1).map(
-    lambda x: Bytes32(x.to_bytes(32, "little"))
-)
+bytes32 = st.binary(min_size=32, max_size=32).map(Bytes32)
 hash32 = bytes32.map(Hash32)
 root = bytes32.map(Root)
-bytes256 = st.integers(min_value=0, max_value=2**2048 - 1).map(
-    lambda x: Bytes256(x.to_bytes(256, "little"))
-)
+bytes256 = st.binary(min_size=256, max_size=256).map(Bytes256)
 bloom = bytes256.map(Bloom)
 
 excess_blob_gas = st.integers(min_value=0, max_value=MAX_BLOB_GAS_PER_BLOCK * 2).map(
@@ -138,6 +129,29 @@ extended = st.recursive(
 )
 
 
+_U256_ZERO = U256(0)
+
+
+def _none_factory():
+    return None
+
+
+def _u256_zero_factory():
+    return _U256_ZERO
+
+
+def _default_factory(default):
+    """
+    Returns the default_factory of the trie data for a default value.
+    The None and U256(0) factories are shared across draws instead of new closures.
+    """
+    if default is None:
+        return _none_factory
+    if type(default) is U256 and default == _U256_ZERO:
+        return _u256_zero_factory
+    return lambda: default
+
+
 def trie_strategy(thing, min_size=0, include_none=False):
     key_type, value_type = thing.__args__
     value_type_origin = get_origin(value_type) or value_type
@@ -146,7 +160,7 @@ def trie_strategy(thing, min_size=0, include_none=False):
     if value_type_origin is Union and type(None) in get_args(value_type):
         default_strategy = st.none()
     elif value_type is U256:
-        default_strategy = st.just(U256(0))
+        default_strategy = st.just(_U256_ZERO)
     else:
         default_strategy = st.nothing()
 
@@ -178,7 +192,7 @@ def trie_strategy(thing, min_size=0, include_none=False):
                 non_default_strategy(default),
                 min_size=min_size,
                 max_size=15,
-            ).map(lambda x: defaultdict(lambda: default, x)),
+            ).map(partial(defaultdict, _default_factory(default))),
         )
     )
 
@@ -203,18 +217,16 @@ class TypedTuple(tuple, Generic[T1, T2]):
 
 def tuple_strategy(thing):
     types = thing.__args__
+    # Subscript the generic once rather than on each draw
+    typed_tuple = TypedTuple[types]
 
     # Handle ellipsis tuples
     if len(types) == 2 and types[1] == Ellipsis:
-        return (
-            st.lists(st.from_type(types[0]), max_size=MAX_TUPLE_SIZE)
-            .map(tuple)
-            .map(lambda x: TypedTuple[types](x))
+        return st.lists(st.from_type(types[0]), max_size=MAX_TUPLE_SIZE).map(
+            typed_tuple
         )
 
-    return st.tuples(*(st.from_type(t) for t in types)).map(
-        lambda x: TypedTuple[types](x)
-    )
+    return st.tuples(*(st.from_type(t) for t in types)).map(typed_tuple)
 
 
 K = TypeVar("K")
@@ -233,7 +245,7 @@ def dict_strategy(thing):
         # If the thing contains type information, use it
         key_type, value_type = thing.__args__
         return st.dictionaries(st.from_type(key_type), st.from_type(value_type)).map(
-            lambda x: TypedDict[key_type, value_type](x)
+            TypedDict[key_type, value_type]
         )
     else:
         return st.dictionaries()
@@ -242,14 +254,16 @@ def dict_strategy(thing):
 gas_left = st.integers(min_value=0, max_value=BLOCK_GAS_LIMIT).map(Uint)
 
 accessed_addresses = st.sets(st.from_type(Address), max_size=MAX_ADDRESS_SET_SIZE)
-accessed_storage_keys = st.sets(
-    st.tuples(address, bytes32), max_size=MAX_STORAGE_KEY_SET_SIZE
+# Draws the address and the key of a storage slot from a single 52-byte blob
+storage_key = st.binary(min_size=52, max_size=52).map(
+    lambda x: (Address(x[:20]), Bytes32(x[20:]))
 )
+accessed_storage_keys = st.sets(storage_key, max_size=MAX_STORAGE_KEY_SET_SIZE)
 # Versions strategies with less data in collections
 memory_lite_size = 512
 memory_lite = (
     st.binary(max_size=memory_lite_size)
-    .map(lambda x: x + b"\x00" * ((32 - len(x) % 32) % 32))
+    .map(lambda x: x.ljust((len(x) + 31) & ~31, b"\x00"))
     .map(Memory)
 )
 
@@ -276,67 +290,73 @@ message_lite = st.builds(
     depth=uint,
     should_transfer_value=st.booleans(),
     is_static=st.booleans(),
-    accessed_addresses=st.builds(set, st.just(set())),
-    accessed_storage_keys=st.builds(set, st.just(set())),
+    accessed_addresses=st.builds(set),
+    accessed_storage_keys=st.builds(set),
     parent_evm=st.none(),
 )
 
 # Using this list instead of the hash32 strategy to avoid data_to_large errors
-BLOCK_HASHES_LIST = [Hash32(Bytes32(bytes([i] * 32))) for i in range(256)]
-
-transient_storage = st.sets(
-    address, max_size=MAX_ADDRESS_TRANSIENT_STORAGE_SIZE
-).flatmap(
-    lambda addresses: st.builds(
-        TransientStorage,
-        _tries=st.fixed_dictionaries(
-            {
-                # min_size = 1 because empty tries are deleted from the Dict[Address,Trie] in EELS
-                address: trie_strategy(Trie[Bytes32, U256], min_size=1)
-                for address in addresses
-            }
-        ),
-        _snapshots=st.builds(list, st.just([])),  # Start with empty snapshots list
-    ).map(
-        # Create the original snapshot using copies of the tries
-        lambda storage: TransientStorage(
-            _tries=storage._tries,
-            _snapshots=[
-                {addr: copy_trie(trie) for addr, trie in storage._tries.items()}
-            ],
-        )
+_BLOCK_HASHES_BUFFER = b"".join(bytes((i,)) * 32 for i in range(256))
+BLOCK_HASHES_LIST = [
+    Hash32(Bytes32(_BLOCK_HASHES_BUFFER[i * 32 : (i + 1) * 32])) for i in range(256)
+]
+
+# min_size = 1 because empty tries are deleted from the Dict[Address,Trie] in EELS
+storage_trie_strategy = trie_strategy(Trie[Bytes32, U256], min_size=1)
+
+
+@st.composite
+def _transient_storage(draw):
+    addresses = draw(st.sets(address, max_size=MAX_ADDRESS_TRANSIENT_STORAGE_SIZE))
+    tries = draw(
+        st.fixed_dictionaries({addr: storage_trie_strategy for addr in addresses})
     )
-)
+    # Create the original snapshot using copies of the tries
+    return TransientStorage(
+        _tries=tries,
+        _snapshots=[{addr: copy_trie(trie) for addr, trie in tries.items()}],
+    )
+
+
+transient_storage = _transient_storage()
+
 
 # Fork
-environment_lite = st.integers(
-    min_value=0, max_value=2**64 - 1
-).flatmap(  # Generate block number first
-    lambda number: st.builds(
-        Environment,
-        caller=address,
-        block_hashes=st.lists(
-            st.sampled_from(BLOCK_HASHES_LIST),
-            min_size=min(number, 256),  # number or 256 if number is greater
-            max_size=min(number, 256),
+@st.composite
+def _environment_lite(draw):
+    # Generate block number first, only the block hashes depend on it
+    number = draw(st.integers(min_value=0, max_value=2**64 - 1))
+    num_block_hashes = min(number, 256)  # number or 256 if number is greater
+    return Environment(
+        caller=draw(address),
+        block_hashes=draw(
+            st.lists(
+                st.sampled_from(BLOCK_HASHES_LIST),
+                min_size=num_block_hashes,
+                max_size=num_block_hashes,
+            )
         ),
-        origin=address,
-        coinbase=address,
-        number=st.just(Uint(number)),  # Use the same number
-        base_fee_per_gas=uint,
-        gas_limit=uint,
-        gas_price=uint,
-        time=uint256,
-        prev_randao=bytes32,
-        state=st.from_type(State),
-        chain_id=uint64,
-        excess_blob_gas=excess_blob_gas,
-        blob_versioned_hashes=st.lists(
-            st.from_type(VersionedHash), min_size=0, max_size=5
-        ).map(tuple),
-        transient_storage=transient_storage,
+        origin=draw(address),
+        coinbase=draw(address),
+        number=Uint(number),
+        base_fee_per_gas=draw(uint),
+        gas_limit=draw(uint),
+        gas_price=draw(uint),
+        time=draw(uint256),
+        prev_randao=draw(bytes32),
+        state=draw(st.from_type(State)),
+        chain_id=draw(uint64),
+        excess_blob_gas=draw(excess_blob_gas),
+        blob_versioned_hashes=tuple(
+            draw(st.lists(st.from_type(VersionedHash), min_size=0, max_size=5))
+        ),
+        transient_storage=draw(transient_storage),
+        # Required by the EELS Environment, dropped by the patched args_gen one
+        traces=[],
     )
-)
+
+
+environment_lite = _environment_lite()
 
 valid_jump_destinations_lite = st.sets(uint, max_size=MAX_JUMP_DESTINATIONS_SET_SIZE)
 
@@ -348,7 +368,7 @@ valid_jump_destinations_lite = st.sets(uint, max_size=MAX_JUMP_DESTINATIONS_SET_
 memory_size = 2**13
 memory = (
     st.binary(max_size=memory_size)
-    .map(lambda x: x + b"\x00" * ((32 - len(x) % 32) % 32))
+    .map(lambda x: x.ljust((len(x) + 31) & ~31, b"\x00"))
     .map(Memory)
 )
 memory_start_position = bounded_u256_strategy(max_value=memory_size // 2)
@@ -408,25 +428,23 @@ empty_state = st.builds(
         Trie[Address, Optional[Account]],
         secured=st.just(True),
         default=st.none(),
-        _data=st.builds(dict, st.just({})).map(lambda x: defaultdict(lambda: None, x)),
+        _data=st.builds(dict).map(partial(defaultdict, _none_factory)),
     ),
-    _storage_tries=st.builds(dict, st.just({})),
+    _storage_tries=st.builds(dict),
     _snapshots=st.lists(
         st.tuples(
             st.builds(
                 Trie[Address, Optional[Account]],
                 secured=st.just(True),
                 default=st.none(),
-                _data=st.builds(dict, st.just({})).map(
-                    lambda x: defaultdict(lambda: None, x)
-                ),
+                _data=st.builds(dict).map(partial(defaultdict, _none_factory)),
             ),
-            st.builds(dict, st.just({})).map(lambda x: defaultdict(lambda: U256(0), x)),
+            st.builds(dict).map(partial(defaultdict, _u256_zero_factory)),
         ),
         min_size=1,
         max_size=1,
     ),
-    created_accounts=st.builds(set, st.just(set())),
+    created_accounts=st.builds(set),
 )
 
 # https://github.com/ethereum/EIPs/blob/master/EIPS/eip-4788.md
@@ -441,52 +459,50 @@ BEACON_ROOTS_CODE = bytes.fromhex(
 )
 
 # Create the special accounts
-SYSTEM_ACCOUNT = Account(balance=U256(0), nonce=Uint(0), code=bytes())
+SYSTEM_ACCOUNT = Account(balance=U256(0), nonce=Uint(0), code=b"")
 BEACON_ROOTS_ACCOUNT = Account(balance=U256(0), nonce=Uint(1), code=BEACON_ROOTS_CODE)
 
-state = st.lists(address, max_size=MAX_ADDRESS_SET_SIZE, unique=True).flatmap(
-    lambda addresses: st.builds(
-        State,
-        _main_trie=st.builds(
-            Trie[Address, Optional[Account]],
-            secured=st.just(True),
-            default=st.none(),
-            _data=st.fixed_dictionaries(
-                {address: st.from_type(Account) for address in addresses}
-            ).map(lambda x: defaultdict(lambda: None, x)),
-        ),
-        # Storage tries are not always present for existing accounts
-        # Thus we generate a subset of addresses from the existing accounts
-        _storage_tries=st.integers(max_value=len(addresses)).flatmap(
-            lambda i: st.fixed_dictionaries(
-                {
-                    address: trie_strategy(Trie[Bytes32, U256], min_size=1)
-                    for address in addresses[:i]
-                }
-            )
-        ),
-        _snapshots=st.builds(list, st.just([])),
-        created_accounts=st.sets(address, max_size=10),
-    ).map(
-        # Create the original state snapshot using copies of the tries
-        lambda state: State(
-            _main_trie=state._main_trie,
-            _storage_tries=state._storage_tries,
-            # Create deep copies of the tries for the snapshot,
-            # because otherwise mutating the main trie will also mutate the snapshot
-            _snapshots=[
-                (
-                    copy_trie(state._main_trie),
-                    {
-                        addr: copy_trie(trie)
-                        for addr, trie in state._storage_tries.items()
-                    },
+
+@st.composite
+def _state(draw):
+    addresses = draw(st.lists(address, max_size=MAX_ADDRESS_SET_SIZE, unique=True))
+    main_trie = Trie[Address, Optional[Account]](
+        secured=True,
+        default=None,
+        _data=defaultdict(
+            _none_factory,
+            draw(
+                st.fixed_dictionaries(
+                    {addr: st.from_type(Account) for addr in addresses}
                 )
-            ],
-            created_accounts=state.created_accounts,
+            ),
+        ),
+    )
+    # Storage tries are not always present for existing accounts
+    # Thus we generate a subset of addresses from the existing accounts
+    num_storage_tries = draw(st.integers(min_value=0, max_value=len(addresses)))
+    storage_tries = draw(
+        st.fixed_dictionaries(
+            {addr: storage_trie_strategy for addr in addresses[:num_storage_tries]}
         )
-    ),
-)
+    )
+    created_accounts = draw(st.sets(address, max_size=10))
+    # Create deep copies of the tries for the original state snapshot,
+    # because otherwise mutating the main trie will also mutate the snapshot
+    return State(
+        _main_trie=main_trie,
+        _storage_tries=storage_tries,
+        _snapshots=[
+            (
+                copy_trie(main_trie),
+                {addr: copy_trie(trie) for addr, trie in storage_tries.items()},
+            )
+        ],
+        created_accounts=created_accounts,
+    )
+
+
+state = _state()
 
 header = st.builds(
     Header,
@@ -509,8 +525,9 @@ header = st.builds(
 )
 
 
+_MAX_PRIVATE_KEY = int(SECP256K1N) - 1
 private_key = (
-    st.integers(min_value=1, max_value=int(SECP256K1N) - 1)
+    st.integers(min_value=1, max_value=_MAX_PRIVATE_KEY)
     .map(lambda x: int.to_bytes(x, 32, "big"))
     .map(PrivateKey)
 )
@@ -531,12 +548,14 @@ def compute_sqrt_mod_p(a, p):
     Compute the square root of a modulo p using the Tonelli-Shanks algorithm
     which is simplified for p ≡ 3 (mod 4), case of alt_bn128.
     For alt_bn128, we can use the formula: sqrt(a) = a^((p+1)/4) mod p
-    Use Euler's criterion to check if a is a quadratic residue.
+    The candidate root is squared back to check if a is a quadratic residue,
+    which saves the extra exponentiation of Euler's criterion.
     Returns None if a is not one.
     """
-    if pow(a, (p - 1) // 2, p) != 1:
+    y = pow(a, (p + 1) // 4, p)
+    if y * y % p != a % p:
         return None
-    return pow(a, (p + 1) // 4, p)
+    return y
 
 
 def bnp12_generate_valid_point(x_value):
@@ -562,6 +581,10 @@ def bnp12_generate_valid_point(x_value):
     return BNP12(BNF12(x_coords), BNF12(y_coords))
 
 
+# Shrinking replays the same x values, which would recompute the same square roots
+_cached_bnp12_point = lru_cache(maxsize=4096)(bnp12_generate_valid_point)
+
+
 # Point at infinity for BNP12
 bnp12_infinity = BNP12(
     BNF12((0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)),
@@ -571,13 +594,21 @@ bnp12_infinity = BNP12(
 # Strategy for BNP12 points on the curve
 bnp12_strategy = st.one_of(
     st.integers(min_value=1, max_value=BNF12.PRIME - 1)
-    .map(lambda x: bnp12_generate_valid_point(x))
+    .map(_cached_bnp12_point)
     .filter(lambda x: x is not None),
     st.just(bnp12_infinity),
 )
 
 
+_registered = False
+
+
 def register_type_strategies():
+    # Called by the hypothesis entrypoint, guarded in case it is also called directly
+    global _registered
+    if _registered:
+        return
+
     st.register_type_strategy(U64, uint64)
     st.register_type_strategy(Uint, uint)
     st.register_type_strategy(FixedUnsigned, uint)
@@ -627,9 +658,7 @@ def register_type_strategies():
         st.fixed_dictionaries(
             {
                 "key_segment": nibble,
-                "subnode": st.integers(min_value=0, max_value=2**256 - 1).map(
-                    lambda x: x.to_bytes(32, "little")
-                ),
+                "subnode": st.binary(min_size=32, max_size=32),
             }
         ).map(lambda x: ExtensionNode(**x)),
     )
@@ -639,9 +668,7 @@ def register_type_strategies():
             {
                 # 16 subnodes of 32 bytes each
                 "subnodes": st.lists(
-                    st.integers(min_value=0, max_value=2**256 - 1).map(
-                        lambda x: x.to_bytes(32, "little")
-                    ),
+                    st.binary(min_size=32, max_size=32),
                     min_size=16,
                     max_size=16,
                 ).map(tuple),
@@ -669,3 +696,5 @@ def register_type_strategies():
     )
     st.register_type_strategy(BNF12, bnf12_strategy)
     st.register_type_strategy(BNP12, bnp12_strategy)
+    # Only set once all the registrations succeeded
+    _registered = True
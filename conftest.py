@@ -105,5 +105,13 @@ settings.register_profile(
     derandomize=True,
     print_blob=True,
 )
-settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
-logger.info(f"Using Hypothesis profile: {os.getenv('HYPOTHESIS_PROFILE', 'default')}")
+# Default profile: VM runs have a variable latency (e.g. the first run of an entrypoint),
+# so there is no deadline to avoid flaky failures and discarded examples.
+settings.register_profile(
+    "cairo_vm",
+    deadline=None,
+    max_examples=50,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large],
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "cairo_vm"))
+logger.info(f"Using Hypothesis profile: {os.getenv('HYPOTHESIS_PROFILE', 'cairo_vm')}")
@@ -12,7 +12,7 @@ import json
 import logging
 import marshal
 import math
-from functools import partial
+from functools import lru_cache, partial
 from hashlib import md5
 from pathlib import Path
 from time import time_ns
@@ -161,6 +161,60 @@ def build_entrypoint(
     return _builtins, _implicit_args, _args, return_data_types
 
 
+def entrypoint_resolver(
+    cairo_programs: List[Program],
+    main_paths: List[Tuple[str, ...]],
+    to_python_type: Callable = to_python_type,
+):
+    """
+    Build a cached resolver returning, for a given entrypoint, the index of the program defining it,
+    its metadata (see build_entrypoint) and the builtins of the program for this entrypoint.
+
+    The programs of a test file don't change between runs, so the identifier lookups are only
+    done on the first run of each entrypoint instead of on every hypothesis example.
+    """
+
+    @lru_cache(maxsize=None)
+    def _resolve(entrypoint: str):
+        program_index = 0
+        try:
+            cairo_programs[0].get_label(entrypoint)
+        except Exception:
+            program_index = 1
+
+        cairo_program = cairo_programs[program_index]
+        entrypoint_metadata = build_entrypoint(
+            cairo_program, entrypoint, main_paths[program_index], to_python_type
+        )
+        return program_index, entrypoint_metadata, cairo_program.builtins
+
+    return _resolve
+
+
+def get_output_stem(request: FixtureRequest, entrypoint: str, kwargs: dict) -> Path:
+    """
+    Create a unique output stem for the given test by using the test file name, the entrypoint and the kwargs.
+
+    Only needed when output files are written (profiling or proof mode), so that the
+    serialization of the kwargs is not paid on every run.
+    """
+    displayed_args = ""
+    if kwargs:
+        try:
+            displayed_args = json.dumps(kwargs)
+        except TypeError as e:
+            logger.debug(f"Failed to serialize kwargs: {e}")
+    output_stem = str(
+        request.node.path.parent
+        / f"{request.node.path.stem}_{entrypoint}_{displayed_args}"
+    )
+    # File names cannot be longer than 255 characters on Unix so we slice the base stem and happen a unique suffix
+    # Timestamp is used to avoid collisions when running the same test multiple times and to allow sorting by time
+    return Path(
+        f"{output_stem[:160]}_{int(time_ns())}_{md5(output_stem.encode()).digest().hex()[:8]}"
+    )
+
+
 def run_python_vm(
     cairo_programs: List[Program],
     cairo_files: List[Path],
@@ -176,25 +230,25 @@ def run_python_vm(
     static_locals: Optional[dict] = None,
     coverage: Optional[Callable[[pl.DataFrame, int], pl.DataFrame]] = None,
 ):
+    resolve_entrypoint = entrypoint_resolver(cairo_programs, main_paths, to_python_type)
+
     def _run(entrypoint, *args, **kwargs):
         # ============================================================================
         # STEP 1: SELECT PROGRAM AND PREPARE ENTRYPOINT METADATA
         # - Rationale: We need to determine which program contains the entrypoint (main or test)
         #   and extract its argument/return type metadata for type conversion and execution.
+        #   The resolution is cached per entrypoint, only the program builtins are reset
+        #   as they are shared between the entrypoints of the program.
         # ============================================================================
-        cairo_program = cairo_programs[0]
-        cairo_file = cairo_files[0]
-        main_path = main_paths[0]
-        try:
-            cairo_program.get_label(entrypoint)
-        except Exception:
-            cairo_program = cairo_programs[1]
-            cairo_file = cairo_files[1]
-            main_path = main_paths[1]
-
-        _builtins, _implicit_args, _args, return_data_types = build_entrypoint(
-            cairo_program, entrypoint, main_path, to_python_type
+        program_index, entrypoint_metadata, program_builtins = resolve_entrypoint(
+            entrypoint
         )
+        cairo_program = cairo_programs[program_index]
+        cairo_file = cairo_files[program_index]
+        main_path = main_paths[program_index]
+        cairo_program.builtins = program_builtins
+
+        _builtins, _implicit_args, _args, return_data_types = entrypoint_metadata
 
         # ============================================================================
         # STEP 2: INITIALIZE RUNNER AND MEMORY ENVIRONMENT
@@ -378,24 +432,11 @@ def run_python_vm(
         if coverage is not None:
             coverage(trace, PROGRAM_BASE)
 
-        # Create a unique output stem for the given test by using the test file name, the entrypoint and the kwargs
-        displayed_args = ""
-        if kwargs:
-            try:
-                displayed_args = json.dumps(kwargs)
-            except TypeError as e:
-                logger.debug(f"Failed to serialize kwargs: {e}")
-        output_stem = str(
-            request.node.path.parent
-            / f"{request.node.path.stem}_{entrypoint}_{displayed_args}"
-        )
-        # File names cannot be longer than 255 characters on Unix so we slice the base stem and happen a unique suffix
-        # Timestamp is used to avoid collisions when running the same test multiple times and to allow sorting by time
-        output_stem = Path(
-            f"{output_stem[:160]}_{int(time_ns())}_{md5(output_stem.encode()).digest().hex()[:8]}"
-        )
+        profile_cairo = request.config.getoption("profile_cairo")
+        if profile_cairo or proof_mode:
+            output_stem = get_output_stem(request, entrypoint, kwargs)
 
-        if request.config.getoption("profile_cairo"):
+        if profile_cairo:
             stats, prof_dict = profile_from_trace(
                 program=cairo_program, trace=trace, program_base=PROGRAM_BASE
             )
@@ -482,28 +523,25 @@ def run_rust_vm(
     serde_cls: Type[SerdeProtocol] = Serde,
     coverage: Optional[Callable[[pl.DataFrame, int], pl.DataFrame]] = None,
 ):
+    resolve_entrypoint = entrypoint_resolver(cairo_programs, main_paths, to_python_type)
+
     def _run(entrypoint, *args, **kwargs):
         # ============================================================================
         # STEP 1: SELECT PROGRAM AND PREPARE ENTRYPOINT METADATA
         # - Rationale: Determine which program contains the entrypoint (main or test)
         #   and extract its argument/return type metadata for type conversion and execution.
         #   Set the program's builtins based on the entrypoint's implicit args.
+        #   The resolution is cached per entrypoint.
         # ============================================================================
-        cairo_program = cairo_programs[0]
-        rust_program = rust_programs[0]
-        cairo_file = cairo_files[0]
-        main_path = main_paths[0]
-        try:
-            cairo_program.get_label(entrypoint)
-        except Exception:
-            cairo_program = cairo_programs[1]
-            rust_program = rust_programs[1]
-            cairo_file = cairo_files[1]
-            main_path = main_paths[1]
-
-        _builtins, _implicit_args, _args, return_data_types = build_entrypoint(
-            cairo_program, entrypoint, main_path, to_python_type
+        program_index, entrypoint_metadata, program_builtins = resolve_entrypoint(
+            entrypoint
         )
+        cairo_program = cairo_programs[program_index]
+        rust_program = rust_programs[program_index]
+        cairo_file = cairo_files[program_index]
+        cairo_program.builtins = program_builtins
+
+        _builtins, _implicit_args, _args, return_data_types = entrypoint_metadata
         cairo_program.data = cairo_program.data + [0x10780017FFF7FFF, 0]  # jmp rel 0
         rust_program.builtins = [
             builtin
@@ -642,26 +680,11 @@ def run_rust_vm(
         if coverage is not None:
             coverage(runner.trace_df, PROGRAM_BASE)
 
-        # Create a unique output stem for the given test by using the test file name, the entrypoint and the kwargs
-        displayed_args = ""
-        if kwargs:
-            try:
-                displayed_args = json.dumps(kwargs)
-            except TypeError as e:
-                logger.debug(f"Failed to serialize kwargs: {e}")
-        output_stem = str(
-            request.node.path.parent
-            / f"{request.node.path.stem}_{entrypoint}_{displayed_args}"
-        )
-        output_stem = str(
-            request.node.path.parent
-            / f"{request.node.path.stem}_{entrypoint}_{displayed_args}"
-        )
-        output_stem = Path(
-            f"{output_stem[:160]}_{int(time_ns())}_{md5(output_stem.encode()).digest().hex()[:8]}"
-        )
+        profile_cairo = request.config.getoption("profile_cairo")
+        if profile_cairo or proof_mode:
+            output_stem = get_output_stem(request, entrypoint, kwargs)
 
-        if request.config.getoption("profile_cairo"):
+        if profile_cairo:
             stats, prof_dict = profile_from_trace(
                 program=cairo_program, trace=runner.trace_df, program_base=PROGRAM_BASE
             )
@@ -1,8 +1,11 @@
+UINT128_MASK = (1 << 128) - 1
+
+
 def int_to_uint256(value):
-    low = value & ((1 << 128) - 1)
+    low = value & UINT128_MASK
     high = value >> 128
     return low, high
 
 
 def uint256_to_int(low, high):
-    return low + high * 2**128
+    return low + (high << 128)